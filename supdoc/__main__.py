@@ -10,20 +10,20 @@ Invoke with `--help` for usage info.
 
 #-------------------------------------------------------------------------------
 
-import argparse
 import logging
-import json
 import sys
+from   types import SimpleNamespace
 
 from   .cache import get_inspector
 from   .exc import FullNameError, ImportFailure, QualnameError
 from   .inspector import inspect_path, Inspector
 from   .path import split
-from   .terminal import print_docs
 
 #-------------------------------------------------------------------------------
 
-def main():
+def get_parser():
+    import argparse
+
     parser = argparse.ArgumentParser()
     # FIXME: Share some arguments with supdoc.inspector.main().
     parser.add_argument(
@@ -54,13 +54,65 @@ def main():
     parser.add_argument(
         "--no-source", dest="source",  action="store_false",
         help="don't include source")
-    args = parser.parse_args()
+    return parser
+
+
+# Flags understood by `parse_args_fast()`, with the attribute and value each
+# sets.  These must agree with the options in `get_parser()`; the unit tests
+# check that they do.  They're not built from the parser, since avoiding it is
+# the point.
+FAST_FLAGS = {
+    "--no-cache"    : ("no_cache", True),
+    "--imports"     : ("imports", True),
+    "--no-imports"  : ("imports", False),
+    "--objdoc"      : ("objdoc", True),
+    "--sdoc"        : ("sdoc", True),
+    "--private"     : ("private", True),
+    "--source"      : ("source", True),
+    "--no-source"   : ("source", False),
+}
+
+def parse_args_fast(argv):
+    """
+    Parses a common command line without building an argparse parser.
+
+    @return
+      The parsed args, or None if `argv` requires the full parser, for
+      instance for `--help`, abbreviated or unknown options, or errors.
+    """
+    args = SimpleNamespace(
+        name        =None,
+        no_cache    =False,
+        imports     =False,
+        objdoc      =False,
+        sdoc        =False,
+        private     =False,
+        source      =False,
+    )
+    for arg in argv:
+        if arg.startswith("-"):
+            try:
+                attr, value = FAST_FLAGS[arg]
+            except KeyError:
+                return None
+            setattr(args, attr, value)
+        elif args.name is None:
+            args.name = arg
+        else:
+            return None
+    return None if args.name is None else args
+
+
+def main():
+    args = parse_args_fast(sys.argv[1 :])
+    if args is None:
+        args = get_parser().parse_args()
 
     # Find the requested object.
     try:
         path, obj = split(args.name)
     except FullNameError:
-        parser.error(f"can't find name: {args.name}")
+        get_parser().error(f"can't find name: {args.name}")
     except ImportFailure as exc:
         logging.error(f"error importing module: {exc.modname}", exc_info=True)
         raise SystemExit(1)
@@ -74,12 +126,17 @@ def main():
         print(error, file=sys.stderr)
         raise SystemExit(1)
 
+    # Import output modules only as needed; the JSON dumps don't need the
+    # terminal machinery, nor vice versa.
     try:
-        if args.sdoc:
-            json.dump(obj, sys.stdout, indent=1, sort_keys=True)
-        elif args.objdoc:
-            json.dump(objdoc, sys.stdout, indent=1, sort_keys=True)
+        if args.sdoc or args.objdoc:
+            import json
+            json.dump(
+                obj if args.sdoc else objdoc,
+                sys.stdout, indent=1, sort_keys=True
+            )
         else:
+            from .terminal import print_docs
             print_docs(
                 inspector, objdoc, path,
                 private=args.private, imports=args.imports, source=args.source,
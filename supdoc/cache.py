@@ -4,6 +4,7 @@ Caching for objdoc data.
 
 from   __future__ import annotations
 
+from   collections import OrderedDict
 from   contextlib import suppress
 from   importlib.machinery import ModuleSpec
 import importlib.util
@@ -13,14 +14,38 @@ import logging
 import os
 from   pathlib import Path
 import sys
+import threading
 
 from   .inspector import VERSION, Inspector
 from   .lib import memo
 from   .modules import find_submodules
 from   .objdoc import Objdoc
 
+# Use orjson to encode and decode cache files, if it's available.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 #-------------------------------------------------------------------------------
 
+def _dumps(jso) -> bytes:
+    """
+    Encodes `jso` as UTF-8 JSON.
+    """
+    if orjson is None:
+        return json.dumps(jso).encode("utf-8")
+    else:
+        return orjson.dumps(jso)
+
+
+def _loads(data: bytes):
+    """
+    Decodes UTF-8 JSON.
+    """
+    return json.loads(data) if orjson is None else orjson.loads(data)
+
+
 class CannotCache(RuntimeError):
     """
     A cache is not able to cache a particular item.
@@ -78,16 +103,15 @@ class Cache:
         if spec.origin is None:
             raise CannotCache(f"not a module file; can't cache: {modname}")
 
-        path = self.__get_path(spec)
-        path = path.parent / (path.name + ".json.gz")
+        path = os.fspath(self.__get_path(spec)) + ".json.gz"
         check = _get_check(spec)
 
         try:
-            file = gzip.open(path, "wt", encoding="utf-8")
+            file = gzip.open(path, "wb")
         except OSError:
             raise CannotCache(f"can't write cache: {modname}")
         with file:
-            json.dump({"check": check, "objdoc": objdoc}, file)
+            file.write(_dumps({"check": check, "objdoc": objdoc}))
 
 
     def __getitem__(self, modname: str) -> Objdoc:
@@ -96,20 +120,19 @@ class Cache:
             raise KeyError(f"can't cache: {modname}")
 
         try:
-            path = self.__get_path(spec)
+            path = os.fspath(self.__get_path(spec)) + ".json.gz"
         except CannotCache:
             raise KeyError(modname)
-        path = path.parent / (path.name + ".json.gz")
 
         try:
-            file = gzip.open(path, "rt", encoding="utf-8")
+            file = gzip.open(path, "rb")
         except FileNotFoundError:
             raise KeyError(modname)
         except OSError as exc:
-            logging.debug(f"can't read objdoc cache: {exc}")
+            logging.debug("can't read objdoc cache: %s", exc)
             raise KeyError(modname)
         with file:
-            cache = json.load(file)
+            cache = _loads(file.read())
 
         if not _compare_check(spec, cache["check"]):
             # Stale cache; clean it up.
@@ -127,13 +150,12 @@ class Cache:
 def is_subpath(path: Path, other: Path):
     """
     True if `path` is a subpath of `other`.
+
+    Compares normalized path strings; doesn't resolve either path.
     """
-    try:
-        Path(path).relative_to(other)
-    except ValueError:
-        return False
-    else:
-        return True
+    path = os.path.normpath(path)
+    other = os.path.normpath(other)
+    return path == other or path.startswith(os.path.join(other, ""))
 
 
 def _get_pycache_path(spec: ModuleSpec) -> Path:
@@ -195,17 +217,109 @@ def DirCache(dir: Path) -> Cache:
 
 #-------------------------------------------------------------------------------
 
+def _get_module_check(modname):
+    """
+    Returns the check for the file of module `modname`, or `None` if it
+    doesn't have one.
+    """
+    try:
+        spec = importlib.util.find_spec(modname)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    try:
+        return _get_check(spec)
+    except (CannotCache, OSError):
+        return None
+
+
 class CachingInspector:
     """
     An inspector with caching.
     """
     
-    def __init__(self, inspector, caches):
+    def __init__(self, inspector, caches, *, max_objdocs=256):
+        """
+        :param max_objdocs:
+          Maximum number of objdocs to keep in memory.
+        """
         self.__inspector = inspector
         self.__caches = tuple(caches)
+        # Objdocs already produced in this process, by modname, each with the
+        # check of its module file at the time, least recently used first.
+        self.__objdocs = OrderedDict()
+        self.__max_objdocs = max_objdocs
+        # Locks for modules currently being produced, by modname, and a lock
+        # to protect these and the objdocs.
+        self.__pending = {}
+        self.__lock = threading.Lock()
+
+
+    def __get_cached(self, modname, check):
+        """
+        Returns the objdoc for `modname` produced earlier, if its module file
+        hasn't changed since.
+
+        :raise KeyError:
+          No current objdoc.
+        """
+        with self.__lock:
+            objdoc, cached_check = self.__objdocs[modname]
+            if cached_check != check:
+                raise KeyError(modname)
+            self.__objdocs.move_to_end(modname)
+        return objdoc
+
+
+    def __put_cached(self, modname, check, objdoc):
+        """
+        Stores the objdoc for `modname`, evicting the least recently used
+        objdocs past the maximum.
+        """
+        with self.__lock:
+            self.__objdocs[modname] = objdoc, check
+            self.__objdocs.move_to_end(modname)
+            while len(self.__objdocs) > self.__max_objdocs:
+                self.__objdocs.popitem(last=False)
 
 
     def inspect_module(self, modname: str) -> Objdoc:
+        """
+        Returns the objdoc for module `modname`.
+
+        Recently used objdocs are kept in memory, and reused as long as the
+        module file is unchanged.  The returned objdoc is shared with other callers, so it
+        must not be modified.
+        """
+        # Check the module file, as the file caches do, since the module may
+        # have been changed and reloaded.
+        check = _get_module_check(modname)
+        try:
+            return self.__get_cached(modname, check)
+        except KeyError:
+            pass
+
+        # If another thread is already producing this objdoc, wait for it
+        # rather than duplicating the work.
+        with self.__lock:
+            lock = self.__pending.setdefault(modname, threading.Lock())
+        try:
+            with lock:
+                try:
+                    return self.__get_cached(modname, check)
+                except KeyError:
+                    pass
+                objdoc = self.__inspect_module(modname)
+                self.__put_cached(modname, check, objdoc)
+                return objdoc
+        finally:
+            # Drop the lock even if inspection failed.
+            with self.__lock:
+                self.__pending.pop(modname, None)
+
+
+    def __inspect_module(self, modname: str) -> Objdoc:
         # Try to use a cached value.
         for cache in self.__caches:
             try:
@@ -240,21 +354,59 @@ def get_inspector():
     return CachingInspector(Inspector(), caches,)
 
 
-def cache_modules(*modnames) -> None:
+def _cache_module(modname) -> None:
+    """
+    Inspects and caches a single module.
+    """
+    logging.debug("inspecting: %s", modname)
+    objdoc = Inspector().inspect_module(modname)
+    logging.debug("writing cache: %s", modname)
+    try:
+        PYCACHE[modname] = objdoc
+    except CannotCache as exc:
+        logging.warning(f"cannot cache: {exc}")
+
+
+def cache_modules(*modnames, jobs=None) -> None:
     """
     Caches modules in `modnames` and their submodules.
+
+    Modules are inspected and cached independently, so this may be done in
+    parallel worker processes.
+
+    :param jobs:
+      The number of worker processes, or `None` to cache modules serially in
+      this process.
     """
-    inspector = Inspector()
-    modnames = { n for m in modnames for n in find_submodules(m) }
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be positive: {jobs}")
 
-    for modname in modnames:
-        logging.debug(f"inspecting: {modname}")
-        objdoc = inspector.inspect_module(modname)
-        logging.debug(f"writing cache: {modname}")
-        try:
-            PYCACHE[modname] = objdoc
-        except CannotCache as exc:
-            logging.warning(f"cannot cache: {exc}")
+    modnames = sorted({ n for m in modnames for n in find_submodules(m) })
+
+    if jobs is None or jobs == 1:
+        for modname in modnames:
+            _cache_module(modname)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Consume results, to propagate exceptions.
+            for _ in executor.map(_cache_module, modnames):
+                pass
+
+
+def _positive_int(string):
+    """
+    Parses a positive integer command line argument.
+    """
+    import argparse
+
+    try:
+        value = int(string)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"not a positive integer: {string}")
+    return value
 
 
 def main():
@@ -265,9 +417,12 @@ def main():
     parser.add_argument(
         "modnames", metavar="MODNAME", nargs="*",
         help="names of modules or packages to cache")
+    parser.add_argument(
+        "--jobs", "-j", metavar="NUM", type=_positive_int, default=None,
+        help="use NUM worker processes [default: cache in this process]")
     args = parser.parse_args()
 
-    cache_modules(*args.modnames)
+    cache_modules(*args.modnames, jobs=args.jobs)
 
 
 if __name__ == "__main__":
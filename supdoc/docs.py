@@ -5,7 +5,7 @@ import re
 import xml.etree.ElementTree as ET
 
 from   .lib.itr import PeekIter
-from   .lib.text import get_indent, get_common_indent, join_pars
+from   .lib.text import get_indent, get_common_indent, join_indented_pars
 
 #-------------------------------------------------------------------------------
 
@@ -26,6 +26,10 @@ JAVADOC_ARG_TAGS = frozenset({
 })
 
 
+# Matches a line starting with a Javadoc-style tag, e.g. "@param x  text".
+# Captures the tag name and the rest of the line.
+JAVADOC_TAG_REGEX = re.compile(r"@(\S+)\s*(.*)", re.DOTALL)
+
 def find_javadoc(lines):
     """
     Finds and separates Javadoc-style tags.
@@ -42,11 +46,8 @@ def find_javadoc(lines):
     tag = None
     for line in lines:
         l = line.strip()
-        try:
-            first, rest = l.split(None, 1)
-        except ValueError:
-            first, rest = l, ""
-        if first.startswith("@") and len(first) > 1:
+        match = JAVADOC_TAG_REGEX.match(l)
+        if match is not None:
             if tag is not None:
                 # Done with the previous tag.
                 javadoc.append(dict(
@@ -54,7 +55,7 @@ def find_javadoc(lines):
                     arg =arg, 
                     text=parse_formatting("\n".join(text)),
                 ))
-            tag = first[1 :]
+            tag, rest = match.groups()
             # Some tags take an argument.
             if tag in JAVADOC_ARG_TAGS and len(rest) > 0:
                 words = rest.split(None, 1)
@@ -99,16 +100,22 @@ DOUBLE_ASTERISK_REGEX   = re.compile(r"(\s)\*\*([^\s].{,128}[^\s])\*\*(\s)")
 ASTERISK_REGEX          = re.compile(r"(\s)\*([^\s].{,128}[^\s])\*(\s)")
 
 def parse_formatting(text):
-    # Look for ``-delimited strings.
-    text = DOUBLE_BACKTICK_REGEX.sub(r'<code>\1</code>', text)
-    # Look for `-delimited strings.
-    text = SINGLE_BACKTICK_REGEX.sub(r'<code>\1</code>', text)
+    # Most text contains no markup at all, so check for each delimiter with a
+    # cheap substring test before running the corresponding regexes.
+
+    if "`" in text:
+        # Look for ``-delimited strings.
+        text = DOUBLE_BACKTICK_REGEX.sub(r'<code>\1</code>', text)
+        # Look for `-delimited strings.
+        text = SINGLE_BACKTICK_REGEX.sub(r'<code>\1</code>', text)
 
     # text = markdown.markdown(text, output_format="html5")
 
-    text = UNDERSCORE_REGEX.sub(r'\1<i>\2</i>\3', text)
-    text = DOUBLE_ASTERISK_REGEX.sub(r'\1<b>\2</b>\3', text)
-    text = ASTERISK_REGEX.sub(r'\1<i>\2</i>\3', text)
+    if "_" in text:
+        text = UNDERSCORE_REGEX.sub(r'\1<i>\2</i>\3', text)
+    if "*" in text:
+        text = DOUBLE_ASTERISK_REGEX.sub(r'\1<b>\2</b>\3', text)
+        text = ASTERISK_REGEX.sub(r'\1<i>\2</i>\3', text)
 
     return text
 
@@ -120,12 +127,12 @@ def parse_doc(source):
     # Filter and parse Javadoc tags.
     lines, javadoc = find_javadoc(lines)
 
-    # Combine lines into paragraphs.
-    pars = join_pars(lines)
+    # Combine lines into paragraphs, removing each one's indentation.
+    pars = join_indented_pars(lines)
 
     # The first paragraph is the summary.
     try:
-        summary = next(pars)
+        _, summary = next(pars)
     except StopIteration:
         summary = None
     else:
@@ -133,7 +140,7 @@ def parse_doc(source):
         summary = parse_formatting(html.escape(summary))
 
     # Remove common indentation.
-    pars = [ get_common_indent(p) for p in pars ] 
+    pars = list(pars)
     min_indent = min(( i for i, _ in pars ), default=0)
     pars = [ (i - min_indent, p) for i, p in pars ]
 
@@ -147,12 +154,13 @@ def parse_doc(source):
                 continue
 
             if len(par) > 0:
-                _, lines = get_common_indent(par)
-                text = " ".join(lines)
+                # Paragraph indentation has already been removed.
+                text = " ".join(par)
                 text = parse_formatting(html.escape(text))
                 yield '<p>' + text + '</p>'
 
-            if len(par) > 0 and par[-1].rstrip().endswith(":"):
+            # Lines were right-stripped when the source was split.
+            if len(par) > 0 and par[-1].endswith(":"):
                 text = []
                 for i, p in pars:
                     if i > indent:
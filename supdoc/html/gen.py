@@ -1,14 +1,16 @@
 import argparse
+import functools
 from   html import escape
 import pygments
 import pygments.lexers
 import pygments.formatters
+import sys
 
 from   .tags import A, BODY, BUTTON, CODE, DIV, HEAD, H2, HTML, LI, LINK, OL, SCRIPT, SPAN, SVG, UL, USE
 from   supdoc import inspector, modules, path
 from   supdoc import terminal  # FIXME
 from   supdoc.exc import QualnameError
-from   supdoc.lib import itr, py
+from   supdoc.lib import itr, memo, py
 from   supdoc.objdoc import is_function_like, is_ref, get_path, get_signature, parse_ref
 from   supdoc.path import Path
 
@@ -100,20 +102,25 @@ def make_url(path):
     return "/{}/{}".format(path.modname, path.qualname or "")
 
 
-# find_modules = memo.memoize(lambda: list(modules.find_modules_in_path))
-find_modules = modules.find_modules_in_path
+@memo.memoize
+def find_modules():
+    """
+    Returns names of modules in the import path.
+
+    Searching the import path walks the file system, so this is done once,
+    not for each page.
+    """
+    return tuple(modules.find_modules_in_path())
+
 
 def format_module_list():
     module_list = UL(DIV("Modules", cls="heading"))
     for modname in find_modules():
-        if "." in modname:
+        # Split the name into parts once, for the depth and last component.
+        *parents, name = modname.split(".")
+        if len(parents) > 0:
             # For submodules, show only the last component, but indented.
-            name = (
-                "&nbsp;" * (2 * modname.count("."))
-                + "." + modname.rsplit(".", 1)[1]
-            )
-        else:
-            name = modname
+            name = "&nbsp;" * (2 * len(parents)) + "." + name
         module_list << LI(A(
             CODE(name, cls="modname identifier"), 
             href=make_url(Path(modname))
@@ -359,8 +366,7 @@ def format_member(docsrc, objdoc, lookup_path, *, context_path=None,
 
 def format_members(docsrc, dict, parent_path, show_type=True, imports=True):
     div = DIV(cls="members")
-    for name in sorted(dict):
-        objdoc = dict[name]
+    for name, objdoc in dict.items():
         if imports or not is_ref(objdoc):
             # FIXME: Even if parent_path is None, we need to pass the local
             # name, in case the object doesn't know its own name.
@@ -385,14 +391,25 @@ def format_source(source):
             div << " lines {}-{}".format(start + 1, end + 1)
 
     if source_text is not None:
-        lexer = pygments.lexers.get_lexer_by_name("python")
-        formatter = pygments.formatters.get_formatter_by_name(
-            "html", cssclass="source")
-        div << pygments.highlight(source_text, lexer, formatter)
+        div << _highlight_source(source_text)
 
     return div
 
 
+@functools.lru_cache(maxsize=256)
+def _highlight_source(source_text):
+    """
+    Returns syntax-highlighted HTML for Python `source_text`.
+
+    The result is a string, so it's safe to share between pages that show the
+    same source, for instance an object re-exported from several modules.
+    """
+    lexer = pygments.lexers.get_lexer_by_name("python")
+    formatter = pygments.formatters.get_formatter_by_name(
+        "html", cssclass="source")
+    return pygments.highlight(source_text, lexer, formatter)
+
+
 def generate(docsrc, objdoc, lookup_path):
     # If this is a ref, redirect.
     if is_ref(objdoc):
@@ -595,7 +612,8 @@ def main():
     objdoc = docsrc.get(lookup_path)
 
     print("<!DOCTYPE html>")
-    print(generate(docsrc, objdoc, lookup_path))
+    generate(docsrc, objdoc, lookup_path).write_to(sys.stdout)
+    print()
 
 
 if __name__ == "__main__":
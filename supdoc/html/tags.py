@@ -10,40 +10,98 @@ from   supdoc.lib import py
 
 class Element:
 
+    __slots__ = (
+        "_Element__name", "_Element__children", "_Element__attrs",
+        "_Element__tag",
+    )
+
     def __init__(self, name, *children, **attrs):
         self.__name = name
         self.__children = []
         self.__attrs = {}
+        # The formatted begin and end tags, or None if not yet formatted.
+        self.__tag = None
         self.extend(children)
         self.update(attrs)
 
 
     @property
     def tag(self):
-        if len(self.__attrs) > 0:
-            attrs = " " + " ".join( 
-                a if v is None else '{}="{}"'.format(a, v) 
-                for a, v in self.__attrs.items() 
+        """
+        The begin and end tags.
+
+        These are formatted once, and again only if attributes change.
+        """
+        tag = self.__tag
+        if tag is None:
+            if len(self.__attrs) > 0:
+                attrs = " " + " ".join( 
+                    a if v is None else '{}="{}"'.format(a, v) 
+                    for a, v in self.__attrs.items() 
+                )
+            else:
+                attrs = ""
+            tag = self.__tag = (
+                "<{}{}>".format(self.__name, attrs), 
+                "</{}>".format(self.__name),
             )
-        else:
-            attrs = ""
-        return "<{}{}>".format(self.__name, attrs), "</{}>".format(self.__name)
+        return tag
 
 
     def __str__(self):
+        parts = []
+        self._format_into(parts)
+        return "".join(parts)
+
+
+    def _format_into(self, parts):
+        """
+        Appends the HTML for this element and its children to list `parts`.
+
+        This lets `str()` join the HTML for an entire tree once, rather than
+        once for each level of nesting.
+        """
+        begin, end = self.tag
+        parts.append(begin)
+        for child in self.__children:
+            if isinstance(child, Element):
+                child._format_into(parts)
+            else:
+                parts.append(child)
+        parts.append(end)
+
+
+    def write_to(self, out):
+        """
+        Writes the HTML for this element and its children to `out`.
+
+        Unlike `str()`, doesn't build the entire HTML in memory.
+
+        @param out
+          A file-like object with a `write()` method.
+        """
         begin, end = self.tag
-        return begin + "".join( str(c) for c in self.__children ) + end
+        write = out.write
+        write(begin)
+        for child in self.__children:
+            if isinstance(child, Element):
+                child.write_to(out)
+            else:
+                write(child)
+        write(end)
 
 
     def format(self, indent=0):
         begin, end = self.tag
-        yield " " * indent + begin
+        prefix = " " * indent
+        child_prefix = prefix + " "
+        yield prefix + begin
         for child in self.__children:
             if isinstance(child, Element):
                 yield from child.format(indent + 1)
             else:
-                yield " " * (indent + 1) + child
-        yield " " * indent + end
+                yield child_prefix + child
+        yield prefix + end
 
 
     def __setitem__(self, name, value):
@@ -56,6 +114,8 @@ class Element:
             value = " ".join( str(c) for c in py.tupleize(value) )
 
         self.__attrs[name] = value
+        # Reformat the tags next time.
+        self.__tag = None
 
 
     def update(self, attrs={}, **kw_attrs):
@@ -66,8 +126,15 @@ class Element:
 
 
     def append(self, child):
+        """
+        Appends a child element or text.
+
+        Text is HTML, and is not escaped.  Anything else that isn't an element
+        is converted to text once, here.
+        """
         if child is not None:
-            self.__children.append(child)
+            self.__children.append(
+                child if isinstance(child, (Element, str)) else str(child))
         return child
 
 
@@ -114,6 +114,55 @@ def has_code(obj):
     )
 
 
+# Cache of signatures of callables, which are expensive to compute.
+_signatures = WeakKeyDictionary()
+
+def _get_signature(obj):
+    """
+    Returns the signature of callable `obj`, cached if possible.
+
+    :raise ValueError:
+      No signature is available for `obj`.
+    """
+    try:
+        return _signatures[obj]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not hashable or doesn't support weakrefs.
+        return inspect.signature(obj)
+
+    sig = _signatures[obj] = inspect.signature(obj)
+    return sig
+
+
+# Cache of source file information for modules.
+_module_files = WeakKeyDictionary()
+
+def _get_module_files(module):
+    """
+    Returns source file information for `module`, cached.
+
+    Every class and function in a module shares this, so look it up only once
+    per module.
+
+    :return:
+      A JSO object with "source_file" and "file" keys, if available.
+    """
+    try:
+        return _module_files[module]
+    except KeyError:
+        pass
+
+    files = {}
+    with suppress(TypeError):
+        files["source_file"] = inspect.getsourcefile(module)
+    with suppress(TypeError):
+        files["file"] = inspect.getfile(module)
+    _module_files[module] = files
+    return files
+
+
 def is_mangled(obj):
     """
     Returns true if `obj` has a mangled private name.
@@ -181,10 +230,7 @@ class Inspector:
 
         module = inspect.getmodule(obj)
         if module is not None:
-            with suppress(TypeError):
-                result["source_file"] = inspect.getsourcefile(module)
-            with suppress(TypeError):
-                result["file"] = inspect.getfile(module)
+            result.update(_get_module_files(module))
         try:
             result["source"], result["lines"] = self._get_source(obj)
         except LookupError:
@@ -260,25 +306,33 @@ class Inspector:
             else:
                 return objdoc
 
-        if isinstance(obj, types.ModuleType):
-            LOG.info(f"inspecting module {obj.__name__}")
+        # Check the object's type once, up front.
+        typ = type(obj)
+        is_module = isinstance(obj, types.ModuleType)
+        is_type = isinstance(obj, type)
+        is_callable = callable(obj)
+        code = has_code(obj)
+
+        if is_module:
+            LOG.info("inspecting module %s", obj.__name__)
         else:
-            LOG.debug(f"inspecting {lookup_path}")
+            # Format lazily; this is called for every object.
+            LOG.debug("inspecting %s", lookup_path)
 
         objdoc = {}
 
-        if Path.of(type(obj)) is not None:
-            objdoc["type"] = self._inspect_ref(type(obj))
+        if Path.of(typ) is not None:
+            objdoc["type"] = self._inspect_ref(typ)
         # FIXME: Get rid of this; we shouldn't need it.
-        objdoc["type_name"] = type(obj).__name__
+        objdoc["type_name"] = typ.__name__
 
         # Add the repr, unless it's the default repr.
-        is_default_repr = type(obj).__repr__ is object.__repr__
+        is_default_repr = typ.__repr__ is object.__repr__
         if not is_default_repr:
             try:
                 obj_repr = repr(obj)
             except Exception:
-                LOG.warning(f"failed to get repr", exc_info=True)
+                LOG.warning("failed to get repr", exc_info=True)
             else:
                 objdoc["repr"] = obj_repr[: MAX_REPR_LENGTH]
 
@@ -299,12 +353,12 @@ class Inspector:
         # Everything that actually is in a module, i.e. is code, such as as 
         # class or function, is an instance of a builtin type.  Anything else
         # that reports a __modname__ is probably getting it from its own type.
-        modname = getattr(obj, "__module__", None) if has_code(obj) else None
+        modname = getattr(obj, "__module__", None) if code else None
         if modname is not None:
             # Convert the module name into a ref.
             objdoc["module"] = make_ref(Path(modname, None))
 
-        if isinstance(obj, types.ModuleType):
+        if is_module:
             try:
                 all_names = obj.__all__
             except AttributeError:
@@ -348,7 +402,7 @@ class Inspector:
 
             objdoc["dict"] = dict_jso
 
-        if isinstance(obj, (type, types.ModuleType, types.FunctionType)):
+        if is_type or is_module or typ is types.FunctionType:
             objdoc["source"] = self._inspect_source(obj)
 
         try:
@@ -367,10 +421,10 @@ class Inspector:
 
         # If this is callable, get its signature; however, skip types, as we 
         # get their __init__ signature.
-        objdoc["callable"] = callable(obj)
-        if callable(obj) and not isinstance(obj, type):
+        objdoc["callable"] = is_callable
+        if is_callable and not is_type:
             try:
-                sig = inspect.signature(obj)
+                sig = _get_signature(obj)
             except ValueError:
                 # Doesn't work for extension functions.
                 pass
@@ -401,11 +455,11 @@ class Inspector:
         # Get documentation, if it belongs to this object itself (not to the
         # object's type).
         # FIXME: Maybe just compare obj.__doc__ to type(obj).__doc__?
-        doc = getattr(obj, "__doc__", None) if has_code(obj) else None
+        doc = getattr(obj, "__doc__", None) if code else None
         if (    doc is not None 
             and isinstance(doc, str)
-            and (isinstance(obj, type) 
-                 or doc != getattr(type(obj), "__doc__", None))):
+            and (is_type
+                 or doc != getattr(typ, "__doc__", None))):
             objdoc["docs"] = {"doc": doc}
             # Parse and process docs.
             enrich(objdoc)
@@ -473,7 +527,7 @@ class Inspector:
         try:
             obj = import_(modname)
         except ImportError:
-            LOG.info(f"skipping unimportable module {modname}")
+            LOG.info("skipping unimportable module %s", modname)
             return {}
 
         cache = WeakKeyDictionary()
@@ -12,6 +12,8 @@ class Dotname:
     """
     SEP = "."
 
+    __slots__ = ("_Dotname__str", "_Dotname__parts")
+
     @classmethod
     def _assert_valid(cls_, parts):
         """
@@ -30,8 +32,13 @@ class Dotname:
 
         `part` and `parts` may be parts or fragments containing the separator.
         """
-        parts = (str(part), ) + tuple( str(p) for p in parts )
-        self.__str = self.SEP.join(parts)
+        if len(parts) == 0:
+            # Common case: a single string or dotname.  Don't build and join a
+            # tuple of one.
+            self.__str = str(part)
+        else:
+            self.__str = self.SEP.join(
+                (str(part), ) + tuple( str(p) for p in parts ))
         self.__parts = tuple(self.__str.split(self.SEP))
 
         try:
@@ -52,28 +59,39 @@ class Dotname:
         return hash(self.__str)
 
 
+    @staticmethod
+    def __key(other):
+        """
+        Returns the value to compare with our string, for `other`.
+
+        Uses the cached string of another dotname, rather than dispatching
+        back to its comparison methods.
+        """
+        return other.__str if isinstance(other, Dotname) else other
+
+
     def __eq__(self, other):
-        return other is self or other == self.__str
+        return other is self or self.__str == self.__key(other)
 
 
     def __ne__(self, other):
-        return other is not self and other != self.__str
+        return other is not self and self.__str != self.__key(other)
 
 
     def __lt__(self, other):
-        return other is not self and other > self.__str
+        return other is not self and self.__str < self.__key(other)
 
 
     def __gt__(self, other):
-        return other is not self and other < self.__str
+        return other is not self and self.__str > self.__key(other)
 
 
     def __le__(self, other):
-        return other is self or other >= self.__str
+        return other is self or self.__str <= self.__key(other)
 
 
     def __ge__(self, other):
-        return other is self or other <= self.__str
+        return other is self or self.__str >= self.__key(other)
 
 
     @classmethod
@@ -137,16 +155,42 @@ class Dotname:
 
 
     def __truediv__(self, part):
-        return type(self)(self.__str, part)
+        return self.joinpath(part)
 
 
     def joinpath(self, *parts):
-        return type(self)(self.__str, *parts)
+        """
+        Returns this name extended with `parts`.
+
+        `parts` may be parts or fragments containing the separator.  Only the
+        new parts are split and validated; our own parts are reused as is.
+        """
+        if len(parts) == 0:
+            return self
+        parts = tuple(self.SEP.join( str(p) for p in parts ).split(self.SEP))
+        try:
+            self._assert_valid(parts)
+        except AssertionError as exc:
+            raise ValueError(str(exc)) from None
+        return self._from_parts(self.__parts + parts)
 
 
     def relative_to(self, other):
-        # FIXME
-        pass
+        """
+        Returns the part of this name following `other`.
+
+        :raise ValueError:
+          This name does not extend `other`.
+        """
+        if not isinstance(other, Dotname):
+            other = Dotname(other)
+        # Compare the leading parts directly, rather than stripping one part at
+        # a time.
+        count = len(other.__parts)
+        if (    len(self.__parts) <= count
+            or self.__parts[: count] != other.__parts):
+            raise ValueError(f"{self} does not extend {other}")
+        return self._from_parts(self.__parts[count :])
 
 
     def with_name(self, name):
@@ -158,6 +202,8 @@ class Dotname:
 
 class Qualname(Dotname):
 
+    __slots__ = ()
+
     @classmethod
     def _assert_valid(cls_, parts):
         Dotname._assert_valid(parts)
@@ -95,10 +95,9 @@ class PeekIter:
 
 
     def __next__(self):
-        try:
-            return self.__items.popleft()
-        except IndexError:
-            return next(self.__iter)
+        # Usually nothing is pushed back, so check instead of catching.
+        items = self.__items
+        return items.popleft() if items else next(self.__iter)
 
 
     @property
@@ -110,7 +109,7 @@ class PeekIter:
             return False
         else:
             try:
-                self.__items.append(next(self._iter))
+                self.__items.append(next(self.__iter))
             except StopIteration:
                 return True
             else:
@@ -1,6 +1,7 @@
 import functools
 import inspect
 import logging
+import sys
 from   logging import DEBUG, INFO, WARNING, ERROR, CRITICAL
 from   logging import debug, info, warning, error, critical
 
@@ -67,7 +68,7 @@ def get(name=None):
       The logger name.  If `None`, uses the caller's global `__name__`.
     """
     if name is None:
-        frame = inspect.stack()[1][0]
+        frame = sys._getframe(1)
         try:
             name = frame.f_globals["__name__"]
         except KeyError:
@@ -78,6 +79,23 @@ def get(name=None):
 
 #-------------------------------------------------------------------------------
 
+class _FormattedCall:
+    """
+    Formats a call lazily, only if the log record is actually emitted.
+    """
+
+    __slots__ = ("name", "args", "kw_args")
+
+    def __init__(self, name, args, kw_args):
+        self.name = name
+        self.args = args
+        self.kw_args = kw_args
+
+
+    def __str__(self):
+        return py.format_call(self.name, *self.args, **self.kw_args)
+
+
 def log_call(log=logging.debug, *, show_self=False):
     """
     Returns a decorator that logs calls to a method.
@@ -105,13 +123,18 @@ def log_call(log=logging.debug, *, show_self=False):
             and itr.nth(inspect.signature(fn).parameters, 0) == "self"
         )
 
-        @functools.wraps(fn)
-        def wrapped(*args, **kw_args):
-            log(py.format_call(
-                name, *(args[1 :] if remove_self else args), **kw_args))
-            return fn(*args, **kw_args)
+        # Choose the wrapper now, rather than testing on each call.
+        if remove_self:
+            def wrapped(self, *args, **kw_args):
+                log("%s", _FormattedCall(name, args, kw_args))
+                return fn(self, *args, **kw_args)
+
+        else:
+            def wrapped(*args, **kw_args):
+                log("%s", _FormattedCall(name, args, kw_args))
+                return fn(*args, **kw_args)
 
-        return wrapped
+        return functools.wraps(fn)(wrapped)
 
     return log_call
 
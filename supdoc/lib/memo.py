@@ -14,18 +14,20 @@ __all__ = [
 
 #-------------------------------------------------------------------------------
 
+# Sentinel for missing memo entries.
+_MISSING = object()
+
 def memoize_with(memo):
     def memoize(fn):
         @functools.wraps(fn)
         def memoized(*args, **kw_args):
             # FIXME: It would be better to bind to the signature first, to pick
             # up default arguments.
-            key = args + tuple(sorted(kw_args.items()))
-            try:
-                return memo[key]
-            except KeyError:
+            key = args + tuple(sorted(kw_args.items())) if kw_args else args
+            value = memo.get(key, _MISSING)
+            if value is _MISSING:
                 value = memo[key] = fn(*args, **kw_args)
-                return value
+            return value
 
         memoized.__memo__ = memo
         return memoized
@@ -35,9 +37,13 @@ def memoize_with(memo):
 
 def memoize(fn):
     """
-    Memoizes with a new empty `dict`.
+    Memoizes with an unbounded cache.
+
+    Uses `functools.lru_cache`, whose wrapper is implemented in C.  Unlike
+    `memoize_with()`, arguments passed by keyword in different orders are
+    cached separately.
     """
-    return memoize_with({})(fn)
+    return functools.lru_cache(maxsize=None)(fn)
 
 
 def memoize_method(fn):
@@ -62,13 +68,15 @@ def memoize_method(fn):
     @functools.wraps(fn)
     def memoized(self, *args, **kw_args):
         # FIXME: Bind to signature first.
-        key = args + tuple(sorted(kw_args.items()))
-        memo = self.__dict__.setdefault(name, {})
-        try:
-            return memo[key]
-        except KeyError:
+        # Most calls have no keyword args; don't bother sorting them.
+        key = args + tuple(sorted(kw_args.items())) if kw_args else args
+        memo = self.__dict__.get(name)
+        if memo is None:
+            memo = self.__dict__[name] = {}
+        value = memo.get(key, _MISSING)
+        if value is _MISSING:
             value = memo[key] = fn(self, *args, **kw_args)
-            return value
+        return value
 
     memoized.__memo_name__ = name
     return memoized
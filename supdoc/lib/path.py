@@ -4,6 +4,7 @@ File system path helper code.
 
 #-------------------------------------------------------------------------------
 
+import os
 import pathlib
 
 #-------------------------------------------------------------------------------
@@ -66,7 +67,11 @@ class Path(pathlib.PosixPath):
           False
 
         """
-        return any( p == prefix for p in self.parents )
+        # Both paths are resolved, so compare strings rather than constructing
+        # each parent path.
+        path = os.fspath(self)
+        prefix = os.fspath(prefix)
+        return path == prefix or path.startswith(os.path.join(prefix, ""))
 
 
 
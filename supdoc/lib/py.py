@@ -135,7 +135,7 @@ def format_call(__fn, *args, **kw_args):
         name = str(__fn)
     args = [ repr(a) for a in args ]
     args.extend( n + "=" + repr(v) for n, v in kw_args.items() )
-    return "{}({})".format(name, ", ".join(args))
+    return f"{name}({', '.join(args)})"
 
 
 def format_ctor(obj, *args, **kw_args):
@@ -163,6 +163,9 @@ def import_(name):
     @raise ImportError
       The name could not be imported.
     """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
     __import__(name)
     return sys.modules[name]
 
@@ -178,26 +181,25 @@ def import_look_up(name):
     """
     # Split the name into parts.
     parts = name.split(".")
-    # Try to import as much of the name as possible.
-    # FIXME: Import left to right as much as possible.
-    for i in range(len(parts) + 1, 0, -1):
-        module_name = ".".join(parts[: i])
+    # Import from left to right as much as possible.  Importing a module also
+    # imports its parents, so stop at the first failure.
+    count = 0
+    while count < len(parts):
         try:
-            obj = import_(module_name)
+            obj = import_(".".join(parts[: count + 1]))
         except ImportError:
-            pass
-        else:
-            # Imported some.  Resolve the rest with getattr.
-            for j in range(i, len(parts)):
-                try:
-                    obj = getattr(obj, parts[j])
-                except AttributeError:
-                    raise NameError(name) from None
-            else:
-                # Found all parts.
-                return obj
-    else:
+            break
+        count += 1
+    if count == 0:
         raise NameError(name)
+
+    # Resolve the rest with getattr.
+    for part in parts[count :]:
+        try:
+            obj = getattr(obj, part)
+        except AttributeError:
+            raise NameError(name) from None
+    return obj
     
 
 def export(obj):
@@ -231,7 +233,7 @@ def export(obj):
         raise TypeError("obj must have a simple __qualname__")
 
     # Get the caller's globals.
-    glbls = inspect.stack()[1][0].f_globals
+    glbls = sys._getframe(1).f_globals
     # Get or add an __all__ list.
     all_names = glbls.setdefault("__all__", [])
     # Add the name.
@@ -1,4 +1,5 @@
 from   contextlib import closing
+import functools
 import os
 import shutil
 import sys
@@ -39,12 +40,16 @@ def _determine_size():
     raise RuntimeError("can't determine terminal size")
 
 
+@functools.lru_cache(maxsize=1)
 def get_size():
     """
     Returns the terminal size.
 
     Like `shutil.get_terminal_size()`, but works better.  Honors the COLUMNS and
     LINES environment variables, if set.  Otherwise, uses `_determine_size()`.
+
+    The size is determined once and cached; call `get_size.cache_clear()` to
+    determine it again, for instance after the terminal is resized.
     """
     try:
         columns = int(os.environ['COLUMNS'])
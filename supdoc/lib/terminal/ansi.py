@@ -302,7 +302,8 @@ ESCAPE_REGEX = re.compile(re.escape(CSI) + r"[^@-~]*.")
 
 # FIXME: Use extension version from fixfmt.
 def length(string):
-    return len(ESCAPE_REGEX.sub("", string))
+    # Most strings contain no escapes at all.
+    return len(ESCAPE_REGEX.sub("", string)) if ESC in string else len(string)
 
 
 # FIXME: Elsewhere.
@@ -347,13 +348,12 @@ class StyleStack:
         @return
           Escape codes to produce the new style.
         """
-        bad_keys = set(styles) - set(self.DEFAULT_STYLE)
+        bad_keys = styles.keys() - self.DEFAULT_STYLE.keys()
         if len(bad_keys) > 0:
             raise TypeError("unknown styles: " + ", ".join(bad_keys))
 
         old = self.__stack[-1]
-        new = old.copy()
-        new.update(styles)
+        new = {**old, **styles}
         self.__stack.append(new)
         return sgr(**dict_diff(old, new))
 
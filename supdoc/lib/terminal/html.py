@@ -1,7 +1,6 @@
-import html.entities
-import html.parser
 import io
 import logging
+import lxml.html
 import re
 import sys
 
@@ -9,6 +8,31 @@ from   .printer import Printer, NL
 
 LOG = logging.getLogger(__name__)
 
+#-------------------------------------------------------------------------------
+
+# Characters that lxml won't accept in a string, replaces, or truncates at:
+# control characters other than tab, newline, and carriage return, and lone
+# surrogates.
+CONTROL_REGEX = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff]")
+
+# Translations between these characters and placeholders from the
+# supplementary private use area, which lxml passes through.
+_TO_PLACEHOLDERS = {
+    c: 0xf0000 + c
+    for c in (
+        *range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20),
+        *range(0xd800, 0xe000),
+    )
+}
+_FROM_PLACEHOLDERS = { p: c for c, p in _TO_PLACEHOLDERS.items() }
+
+def _restore(string):
+    """
+    Restores characters replaced by placeholders in `string`.
+    """
+    return string.translate(_FROM_PLACEHOLDERS)
+
+
 #-------------------------------------------------------------------------------
 
 # FIXME: 
@@ -16,10 +40,13 @@ LOG = logging.getLogger(__name__)
 # - Elide / truncate words longer than width?
 # - French spacing.
 
-class Converter(html.parser.HTMLParser):
+class Converter:
     """
     Prints HTML to a fixed-width ANSI terminal.
 
+    The HTML is parsed with lxml, and the resulting tree is walked to produce
+    start tag, end tag, and text events, much like `html.parser.HTMLParser`.
+
     For each HTML element, style is given by a tuple,
 
         `(indent, prefix, prenl, postnl, style)`
@@ -84,8 +111,6 @@ class Converter(html.parser.HTMLParser):
 
 
     def __init__(self, printer):
-        super().__init__(convert_charrefs=True)
-
         self.__printer = printer
         self.__tag_stack = []
 
@@ -98,38 +123,83 @@ class Converter(html.parser.HTMLParser):
 
 
     def convert(self, html, style={}):
-        self.reset()
         if style:
             self.__printer.style(**style)
         self.feed(html)
-        self.close()
         if style:
             self.__printer.unstyle()
 
 
+    def feed(self, html):
+        """
+        Parses `html` and prints it.
+        """
+        # lxml rejects, replaces, or truncates at some characters, which may
+        # appear in docstrings, so swap them for placeholders and restore them
+        # in tags, attributes, and text.
+        if CONTROL_REGEX.search(html) is None:
+            restore = None
+        else:
+            html = html.translate(_TO_PLACEHOLDERS)
+            restore = _restore
+
+        # Wrap the fragment in a parent element, but don't handle the parent.
+        root = lxml.html.fragment_fromstring(html, create_parent=True)
+        if root.text:
+            self.__handle_data(root.text, restore)
+        for elem in root:
+            self.__walk(elem, restore)
+
+
+    def __walk(self, elem, restore):
+        """
+        Handles `elem`, its contents, and its tail text.
+
+        :param restore:
+          Function to restore placeholders in strings, or `None`.
+        """
+        tag = elem.tag
+        # Skip comments and processing instructions, whose tags aren't strings,
+        # but not their tails.
+        if isinstance(tag, str):
+            attrs = elem.items()
+            if restore is not None:
+                tag = restore(tag)
+                attrs = [ (restore(n), restore(v)) for n, v in attrs ]
+            self.handle_starttag(tag, attrs)
+            if elem.text:
+                self.__handle_data(elem.text, restore)
+            for child in elem:
+                self.__walk(child, restore)
+            self.handle_endtag(tag)
+        if elem.tail:
+            self.__handle_data(elem.tail, restore)
+
+
+    def __handle_data(self, data, restore):
+        self.handle_data(data if restore is None else restore(data))
+
+
     def __get_tag_style(self, tag, attrs):
         # Spans produced by pygments.
         if tag == "span":
-            attrs = dict(attrs)
-            class_ = attrs.get("class")
-            try:
-                return self.SPAN_CLASSES[class_]
-            except KeyError:
-                LOG.warning(f"unknown span class: {class_}")
-
-        if tag == "div":
-            attrs = dict(attrs)
-            class_ = attrs.get("class")
-            try:
-                return self.DIV_CLASSES[class_]
-            except KeyError:
-                LOG.warning(f"unknown div class: {class_}")
-
-        try:
-            return self.ELEMENTS[tag]
-        except KeyError:
-            LOG.warning(f"unknown tag: {tag}")
-
+            class_ = dict(attrs).get("class")
+            tag_style = self.SPAN_CLASSES.get(class_)
+            if tag_style is not None:
+                return tag_style
+            LOG.warning(f"unknown span class: {class_}")
+
+        elif tag == "div":
+            class_ = dict(attrs).get("class")
+            tag_style = self.DIV_CLASSES.get(class_)
+            if tag_style is not None:
+                return tag_style
+            LOG.warning(f"unknown div class: {class_}")
+
+        tag_style = self.ELEMENTS.get(tag)
+        if tag_style is not None:
+            return tag_style
+        LOG.warning(f"unknown tag: {tag}")
         return self.NO_STYLE
 
 
@@ -178,41 +248,50 @@ class Converter(html.parser.HTMLParser):
 
 
     def __handle_text(self, text):
+        # Work with local copies of state, and store them at the end.
         pr = self.__printer
+        hspace = self.__hspace
+        vspace = self.__vspace
+
+        # Whitespace isn't emitted, but if we see it, require a separation
+        # before the next word.
+        if len(text) > 0 and text[0].isspace():
+            hspace = True
 
-        # Break into words at whitespace boundaries, keeping whitespace.
-        words = [ w for w in re.split(r"(\s+)", text) if len(w) > 0 ]
+        for i, word in enumerate(text.split()):
+            # Words are separated by whitespace.
+            if i > 0:
+                hspace = True
 
-        for word in words:
-            length = len(word)
-            if re.match(r"\s+$", word):  # FIXME
-                # This is whitespace.  Don't emit it, but flag that we've 
-                # seen it and require a separation for the next word.
-                self.__hspace = True
+            # Add vertical space if needed.  The first vspace ends the current
+            # line, so credit it if we're already at the start.
+            if vspace > 0:
+                pr.newline(vspace - (1 if pr.is_start else 0))
+                vspace = 0
 
-            elif len(word) > 0:
-                # Add vertical space if needed.  The first vspace ends the
-                # current line, so credit it if we're already at the start.
-                pr.newline(self.__vspace - (1 if pr.is_start else 0))
-                self.__vspace = 0
+            # Check if this word would take us past the terminal width.
+            if (not pr.is_start
+                and (1 if hspace else 0) + len(word) > pr.remaining):
+                # On to the next line.
+                pr << NL
+                hspace = False
 
-                # Check if this word would take us past the terminal width.
-                if (not pr.is_start
-                    and (1 if self.__hspace else 0) + length > pr.remaining):
-                    # On to the next line.
-                    pr << NL
-                    self.__hspace = False
+            # Don't need a separator at the start of a line.
+            if pr.is_start:
+                hspace = False
 
-                # Don't need a separator at the start of a line.
-                if pr.is_start:
-                    self.__hspace = False
+            # If needed, emit a word separator before emitting the word.
+            if hspace:
+                pr << " "
+                hspace = False
 
-                # If needed, emit a word separator before emitting the word.
-                if self.__hspace:
-                    pr << " "
-                    self.__hspace = False
+            pr << word
 
-                pr << word
+        if len(text) > 0 and text[-1].isspace():
+            hspace = True
+
+        self.__hspace = hspace
+        self.__vspace = vspace
 
 
     def __handle_pre_text(self, text):
@@ -222,11 +301,6 @@ class Converter(html.parser.HTMLParser):
         self.__printer.write(text)
 
 
-    def handle_entityref(self, name):
-        char = chr(html.entities.name2codepoint[name])
-        self.__printer.write(char)
-
-
 
 # FIXME: The width thing is hacky.  This method should only understand inline
 # elements, not block elements, and not do any line splitting.
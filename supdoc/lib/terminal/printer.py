@@ -87,8 +87,10 @@ class Printer:
 
         self.__width = width
         self.__col = None
-        self.__indent = [indent]
-        self.__outdent = [outdent]
+        # Stacks of `(text, length)` pairs, so we needn't measure indentation
+        # each time we use it.
+        self.__indent = [(indent, length(indent))]
+        self.__outdent = [(outdent, length(outdent))]
         self.__style = StyleStack(style)
         self._write = write
 
@@ -119,8 +121,8 @@ class Printer:
         return (
             self.__width
             - self.column
-            - length(self.indentation)
-            - length(self.outdentation)
+            - self.__indent[-1][1]
+            - self.__outdent[-1][1]
         )
 
 
@@ -148,21 +150,31 @@ class Printer:
         """
         if count < 1:
             return
-        self._write(self.__style.current)
-        if self.is_start:
-            self._write(self.indentation)
-        self._write(" " * self.remaining)
-        self._write(self.outdentation + RESET + "\n")
-        self.__col = None
+
+        # Build all the output and write it at once.
+        style = self.__style.current
+        indent, indent_len = self.__indent[-1]
+        outdent, outdent_len = self.__outdent[-1]
+        end = outdent + RESET + "\n"
+
+        # Finish the current line, which may not have been started.
+        text = (
+            style
+            + (indent if self.is_start else "")
+            + " " * self.remaining
+            + end
+        )
         if count > 1:
-            line = (
-                self.__style.current
-                + self.indentation
-                + " " * (self.__width - length(self.indentation) - length(self.outdentation))
-                + self.outdentation
-                + RESET + "\n"
-            )
-            self._write(line * (count - 1))
+            # Add blank lines.
+            text += (
+                style
+                + indent
+                + " " * (self.__width - indent_len - outdent_len)
+                + end
+            ) * (count - 1)
+
+        self._write(text)
+        self.__col = None
 
 
     @property
@@ -170,7 +182,7 @@ class Printer:
         """
         The indentation that will be used for the next line.
         """
-        return self.__indent[-1]
+        return self.__indent[-1][0]
 
 
     @property
@@ -178,7 +190,7 @@ class Printer:
         """
         The right-side indentation that will be used for the next line.
         """
-        return self.__outdent[-1]
+        return self.__outdent[-1][0]
 
 
     def indent(self, indent):
@@ -187,8 +199,9 @@ class Printer:
         """
         # Fix the style of the indentation to the style at the time it was
         # added.
-        indent = self.__indent[-1] + self.__style.current + indent
-        self.__indent.append(indent)
+        text, width = self.__indent[-1]
+        self.__indent.append(
+            (text + self.__style.current + indent, width + length(indent)))
 
 
     def unindent(self):
@@ -231,15 +244,24 @@ class Printer:
 
 
     def write(self, string):
+        write = self._write
+        if "\n" not in string:
+            # Fast path for the common case of a partial line.
+            if len(string) > 0:
+                self._start_line()
+                write(string)
+                self.__col += length(string)
+            return
+
         *lines, last = string.split("\n")
         for line in lines:
             self._start_line()
-            self._write(line)
+            write(line)
             self.__col += length(line)
             self.newline()
         if len(last) > 0:
             self._start_line()
-            self._write(last)
+            write(last)
             self.__col += length(last)
 
 
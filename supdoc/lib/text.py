@@ -1,17 +1,17 @@
-import re
+from   itertools import islice
 
 #-------------------------------------------------------------------------------
 
-_SPACES = re.compile(" *")
-
 def get_indent(line):
-    match = _SPACES.match(line)
-    return 0 if match is None else match.span()[1]
+    """
+    Returns the number of leading spaces in `line`.
+    """
+    return len(line) - len(line.lstrip(" "))
 
 
 def remove_indent(lines):
     lines = list(lines)
-    indent = min( get_indent(l) for l in lines if l.strip() != "" )
+    indent = min(( get_indent(l) for l in lines if l.strip() != "" ), default=0)
     return ( l if l.strip() == "" else l[indent :] for l in lines )
 
 
@@ -30,6 +30,34 @@ def join_pars(lines):
         yield par
 
 
+def join_indented_pars(lines):
+    """
+    Combines lines into paragraphs and removes each paragraph's indentation.
+
+    Like `join_pars()`, but also measures the common indentation of each
+    paragraph as its lines are gathered, so each line is scanned only once.
+
+    @return
+      Generator of `(indent, lines)` pairs, as from `get_common_indent()`.
+    """
+    par = None
+    for line in lines:
+        if line.strip() == "":
+            if par is not None:
+                yield indent, tuple( l[indent :] for l in par )
+            par = None
+        else:
+            line_indent = len(line) - len(line.lstrip(" "))
+            if par is None:
+                par = [line]
+                indent = line_indent
+            else:
+                par.append(line)
+                indent = min(indent, line_indent)
+    if par is not None:
+        yield indent, tuple( l[indent :] for l in par )
+
+
 def get_common_indent(lines, ignore_first=False):
     """
     Extracts the common indentation for lines.
@@ -44,16 +72,23 @@ def get_common_indent(lines, ignore_first=False):
     @return
       The common indentation size, and the lines with that indentation removed.
     """
-    if ignore_first and len(lines) > 1:
-        i, rest = get_common_indent(lines[1 :])
-        lines = (lines[0][min(i, get_indent(lines[0])) :], ) + rest
-        return i, lines
-
-    indent = ( get_indent(l) for l in lines if l.strip() != "" )
-    try:
-        indent = min(indent)
-    except ValueError:
-        indent = 0
-    return indent, tuple( l[indent :] for l in lines )
-
+    # Skip the first line when determining the common indentation.
+    skip = 1 if ignore_first and len(lines) > 1 else 0
+    indent = min(
+        (
+            len(l) - len(l.lstrip(" "))
+            for l in islice(lines, skip, None)
+            if l.strip() != ""
+        ),
+        default=0
+    )
 
+    if skip == 0:
+        return indent, tuple( l[indent :] for l in lines )
+    else:
+        # The first line may be indented less than the others.
+        first = lines[0]
+        return indent, (
+            (first[min(indent, get_indent(first)) :], )
+            + tuple( l[indent :] for l in islice(lines, 1, None) )
+        )
@@ -23,11 +23,50 @@ def is_package_dir(path):
     """
     Returns true if 'path' is a package directory.
     """
-    path = Path(path)
-    return path.is_dir() and (path / "__init__.py").exists()
+    # An existing __init__.py implies that 'path' is a directory.
+    return os.path.isfile(os.path.join(path, "__init__.py"))
 
 
-def find_modules(path, base_path=None):
+def _find_modules(path, base_path, skip):
+    """
+    Implementation of `find_modules()`, for normalized `str` paths.
+    """
+    # Names are derived from paths relative to the base path.
+    base_len = len(os.path.join(base_path, ""))
+
+    def get_name(path):
+        return path[base_len :].replace(os.sep, ".")
+
+    def find_package(path):
+        modname = get_name(path)
+        if skip is not None and skip(modname):
+            # Don't bother walking the package's contents.
+            return
+        yield modname
+        # Use the directory entries' cached file types, rather than stat-ing
+        # each path.
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".py"):
+                    if name != "__init__.py":
+                        yield from find_module(entry.path)
+                elif entry.is_dir() and is_package_dir(entry.path):
+                    yield from find_package(entry.path)
+
+    def find_module(path):
+        modname = get_name(path[: -3])
+        if skip is None or not skip(modname):
+            yield modname
+
+    if path.endswith(".py"):
+        if os.path.basename(path) != "__init__.py":
+            yield from find_module(path)
+    elif is_package_dir(path):
+        yield from find_package(path)
+
+
+def find_modules(path, base_path=None, *, skip=None):
     """
     Generates full names of packages and modules under a top-level package.
 
@@ -40,34 +79,34 @@ def find_modules(path, base_path=None):
     :param base_path:
       The base path to import from (i.e. what would be in the PYTHONPATH).
       If None, uses the parent of 'path'.
+    :param skip:
+      If not None, a predicate on full names.  Modules and packages for which
+      it returns true are omitted, and skipped packages are not searched for
+      submodules.
     """
     path = Path.ensure(path)
     base_path = path.parent if base_path is None else Path.ensure(base_path)
+    if path != base_path and not path.starts_with(base_path):
+        raise ValueError(f"{path} is not in {base_path}")
 
-    def get_name(path):
-        return ".".join(path.with_suffix(None).relative_to(base_path).parts)
-
-    def find(path):
-        if path.suffix == ".py" and path.stem != "__init__":
-            yield get_name(path)
-        elif is_package_dir(path):
-            yield get_name(path)
-            for sub_path in path.iterdir():
-                yield from find(sub_path)
-
-    return find(path)
+    return _find_modules(str(path), str(base_path), skip)
         
 
-def find_all_modules(path):
+def find_all_modules(path, *, skip=None):
     """
     Generates full names of all packages and modules in a directory.
 
     The directory is treated as the PYTHONPATH directory for imports.
+
+    :param skip:
+      See `find_modules()`.
     """
-    base_path = Path.ensure(path)
-    for path in base_path.iterdir():
-        if path.suffix == ".py" or is_package_dir(path):
-            yield from find_modules(path, base_path)
+    base_path = str(Path.ensure(path))
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if (entry.name.endswith(".py")
+                or (entry.is_dir() and is_package_dir(entry.path))):
+                yield from _find_modules(entry.path, base_path, skip)
 
 
 def find_std_modules():
@@ -75,11 +114,9 @@ def find_std_modules():
     Generates full names of Python standard library modules.
     """
     lib_dir = os.path.dirname(inspect.__file__)
-    names = find_all_modules(lib_dir)
-    # Leave out pesky test modules.
-    names = ( n for n in names if "test" not in n )
-
-    return names
+    # Leave out pesky test modules.  Any submodule of a test package is also a
+    # test module, so skip test packages without searching them.
+    return find_all_modules(lib_dir, skip=lambda n: "test" in n)
 
 
 # FIXME: This is bogus and should be removed.
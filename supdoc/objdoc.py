@@ -4,13 +4,16 @@ Functions for working with objdoc and ref objects.
 
 #-------------------------------------------------------------------------------
 
-from   contextlib import suppress
+import re
 import typing
 
 from   .path import Path
 
 Objdoc = typing.NewType("Objdoc", dict)
 
+# An empty objdoc, to look up in place of a missing one.  Never modify it.
+_EMPTY = {}
+
 #-------------------------------------------------------------------------------
 
 def is_ref(obj):
@@ -33,6 +36,10 @@ def make_ref(path):
     return {"$ref": ref}
 
 
+# Matches an absolute ref to a module or an object in one.  Captures the
+# modname, and the qualname parts each preceded by "/dict/".
+REF_REGEX = re.compile(r"#/modules/([^/]+)((?:/dict/[^/]+)*)\Z")
+
 def parse_ref(ref):
     """
     Parses a ref.
@@ -41,12 +48,15 @@ def parse_ref(ref):
       `make_ref()`.
     @rtype
       `Path`.
-    """
-    part0, part1, modname, *parts = ref["$ref"].split("/")
-    assert part0 == "#",        "ref must be absolute in current doc"
-    assert part1 == "modules",  "ref must start with module"
-    assert all( n == "dict" for n in parts[:: 2] )
-    qualname = None if len(parts) == 0 else ".".join(parts[1 :: 2])
+    @raise ValueError
+      The ref isn't an absolute ref to a module or an object in one.
+    """
+    match = REF_REGEX.match(ref["$ref"])
+    if match is None:
+        raise ValueError(f"invalid ref: {ref['$ref']}")
+    modname, parts = match.groups()
+    # Skip the first "/dict/" and convert the rest to dots.
+    qualname = parts[6 :].replace("/dict/", ".") if parts else None
     return Path(modname, qualname)
 
 
@@ -97,16 +107,18 @@ def is_callable(objdoc):
     """
     Returns true if the object is callable or wraps a callable.
     """
-    return objdoc.get("callable") or objdoc.get("func", {}).get("callable")
+    return (
+        objdoc.get("callable")
+        or (objdoc.get("func") or _EMPTY).get("callable")
+    )
 
 
 def is_function_like(objdoc):
     """
     Returns true if `objdoc` is for a function or similar object.
     """
-    try:
-        func = objdoc["func"]
-    except KeyError:
+    func = objdoc.get("func")
+    if func is None:
         return (
             objdoc.get("callable") 
             and objdoc.get("type_name") not in (
@@ -125,10 +137,10 @@ def get_signature(objdoc):
       The signature, or `None` if none is available, for example for a built-in
       or extension function or method.
     """
-    with suppress(KeyError):
-        return objdoc["signature"]
-    with suppress(KeyError):
-        return objdoc["func"]["signature"]
+    signature = objdoc.get("signature")
+    if signature is None:
+        signature = (objdoc.get("func") or _EMPTY).get("signature")
+    return signature
 
 
 # FIXME: Hack.
@@ -329,7 +329,7 @@ if __name__ == '__main__':
     block = Block(content=input.splitlines(), tag='DIV')
     walk(block, split_bullet_list)
     walk(block, split_paragraphs)
-    for line in format_block(block):
-        print(line)
+    # Write the output at once, rather than a print() per line.
+    sys.stdout.write("".join( l + "\n" for l in format_block(block) ))
 
 
@@ -28,12 +28,15 @@ class Path(collections.namedtuple("Path", ("modname", "qualname"))):
       The qualname, or `None` for the module itself.
     """
 
+    # Don't give each instance a dict.
+    __slots__ = ()
+
     def __new__(class_, modname, qualname=None):
         # if modname in ("", None):
         #     raise ValueError("modname may not be empty")
         if qualname == "":
             raise ValueError("qualname may not be empty")
-        return super().__new__(class_, modname, qualname)
+        return tuple.__new__(class_, (modname, qualname))
 
 
     def __repr__(self):
@@ -128,6 +131,11 @@ def import_(modname):
     @raise ImportFailure
       The import of `modname` failed.
     """
+    # Skip the import machinery if the module is already loaded.
+    module = sys.modules.get(modname)
+    if module is not None:
+        return module
+
     try:
         __import__(modname)
     except ImportError:
@@ -216,11 +216,12 @@ def get_dict(objdoc, private):
                         n: v for n, v in dict.items() if n in all_names 
                     }
         else:
-            # For other things, remove private but not special names.
+            # For other things, remove private but not special names.  This
+            # runs for every member, so compare slices instead of calling
+            # startswith() and endswith().
             dict = { 
                 n: v for n, v in dict.items() 
-                if not n.startswith("_")
-                   or (n.startswith("__") and n.endswith("__"))
+                if n[: 1] != "_" or n[: 2] == "__" == n[-2 :]
             }
     
     return dict
@@ -523,8 +524,19 @@ _PARTITIONS = {
 }
 
 def _partition_members(dict):
-    partitions = {}
-    for name, objdoc in dict.items():
+    """
+    Partitions members by type.
+
+    :return:
+      A mapping from partition name to members in that partition, with an
+      entry for each partition.  Members in each are sorted by name.
+    """
+    partitions = {
+        n: {} 
+        for n in ("modules", "types", "properties", "functions", "attributes")
+    }
+    # Sort once; each partition preserves the order.
+    for name, objdoc in sorted(dict.items()):
         type = objdoc.get("type")
         if type is None:
             # Missing type...?
@@ -532,7 +544,7 @@ def _partition_members(dict):
         else:
             type_path = ".".join(get_path(objdoc["type"]))
             partition_name = _PARTITIONS.get(str(type_path), "attributes")
-        partitions.setdefault(partition_name, {})[name] = objdoc
+        partitions[partition_name][name] = objdoc
     return partitions
         
 
@@ -631,7 +643,7 @@ def _print_member(inspector, objdoc, member_name, parent_path, pr, show_type=Tru
 
 
 def _print_members(inspector, dict, parent_path, pr, show_type=True, imports=True):
-    for name, objdoc in sorted(dict.items()):
+    for name, objdoc in dict.items():
         # FIXME: Even if parent_path is None, we need to pass the local
         # name, in case the object doesn't know its own name.
         pr << BULLET
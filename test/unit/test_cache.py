@@ -0,0 +1,71 @@
+import pytest
+
+from   supdoc.cache import CachingInspector
+
+#-------------------------------------------------------------------------------
+
+class FakeInspector:
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+
+    def inspect_module(self, modname):
+        self.calls.append(modname)
+        if self.fail:
+            raise RuntimeError(f"can't inspect {modname}")
+        return {"name": modname}
+
+
+
+def test_inspect_module_reuses_objdoc():
+    inspector = FakeInspector()
+    caching = CachingInspector(inspector, [])
+    objdoc = caching.inspect_module("nosuchmod")
+    assert caching.inspect_module("nosuchmod") is objdoc
+    assert inspector.calls == ["nosuchmod"]
+
+
+def test_inspect_module_raises():
+    inspector = FakeInspector(fail=True)
+    caching = CachingInspector(inspector, [])
+    with pytest.raises(RuntimeError):
+        caching.inspect_module("nosuchmod")
+    assert caching._CachingInspector__pending == {}
+
+    # A later attempt inspects again.
+    inspector.fail = False
+    assert caching.inspect_module("nosuchmod") == {"name": "nosuchmod"}
+    assert inspector.calls == ["nosuchmod", "nosuchmod"]
+    assert caching._CachingInspector__pending == {}
+
+
+def test_inspect_module_evicts_oldest():
+    inspector = FakeInspector()
+    caching = CachingInspector(inspector, [])
+    modnames = [ f"nosuchmod{i}" for i in range(257) ]
+    for modname in modnames:
+        caching.inspect_module(modname)
+    assert len(caching._CachingInspector__objdocs) == 256
+
+    # The most recent is still in memory, but the oldest was evicted.
+    caching.inspect_module(modnames[-1])
+    assert inspector.calls == modnames
+    caching.inspect_module(modnames[0])
+    assert inspector.calls == modnames + modnames[: 1]
+
+
+def test_inspect_module_evicts_least_recently_used():
+    inspector = FakeInspector()
+    caching = CachingInspector(inspector, [], max_objdocs=2)
+    caching.inspect_module("a")
+    caching.inspect_module("b")
+    caching.inspect_module("a")
+    caching.inspect_module("c")  # evicts "b"
+    caching.inspect_module("a")
+    assert inspector.calls == ["a", "b", "c"]
+    caching.inspect_module("b")
+    assert inspector.calls == ["a", "b", "c", "b"]
+
+
@@ -1,3 +1,5 @@
+import pytest
+
 from   supdoc.lib.dotname import Dotname, Qualname
 
 #-------------------------------------------------------------------------------
@@ -32,3 +34,30 @@ def test_join():
     assert n.with_name("bif.bof") == "foo.bar.bif.bof"
 
 
+def test_relative_to():
+    n = Dotname("foo.bar.baz")
+    assert n.relative_to("foo") == "bar.baz"
+    assert n.relative_to(Dotname("foo.bar")) == "baz"
+    with pytest.raises(ValueError):
+        n.relative_to("foo.bar.baz")
+    with pytest.raises(ValueError):
+        n.relative_to("foo.bif")
+    with pytest.raises(ValueError):
+        n.relative_to("fo")
+
+
+def test_compare():
+    n = Dotname("foo.bar")
+    assert n == "foo.bar"
+    assert "foo.bar" == n
+    assert n != "foo.baz"
+    assert n != Dotname("foo.baz")
+    assert n < Dotname("foo.baz")
+    assert n <= Dotname("foo.bar")
+    assert Dotname("foo.baz") > n
+    assert n >= "foo.bar"
+    assert hash(n) == hash(Dotname("foo", "bar")) == hash("foo.bar")
+    assert sorted([Dotname("b"), Dotname("a.c"), Dotname("a")]) \
+        == ["a", "a.c", "b"]
+
+
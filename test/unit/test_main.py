@@ -0,0 +1,46 @@
+import pytest
+
+from   supdoc.__main__ import FAST_FLAGS, get_parser, parse_args_fast
+
+#-------------------------------------------------------------------------------
+
+def _check(argv):
+    fast = parse_args_fast(argv)
+    assert fast is not None
+    assert vars(fast) == vars(get_parser().parse_args(argv))
+
+
+def test_fast_flags_cover_parser():
+    """
+    Every flag option of the parser has a fast flag, and vice versa.
+    """
+    flags = {
+        o
+        for a in get_parser()._actions
+        for o in a.option_strings
+        if o not in ("-h", "--help")
+    }
+    assert flags == set(FAST_FLAGS)
+
+
+def test_parse_args_fast_no_flags():
+    _check(["json"])
+
+
+@pytest.mark.parametrize("flag", sorted(FAST_FLAGS))
+def test_parse_args_fast_flag(flag):
+    _check(["json", flag])
+    _check([flag, "json"])
+
+
+def test_parse_args_fast_combined():
+    _check(["--private", "--imports", "--no-imports", "json.dumps", "--source"])
+
+
+def test_parse_args_fast_falls_back():
+    assert parse_args_fast([]) is None
+    assert parse_args_fast(["--help"]) is None
+    assert parse_args_fast(["--priv", "json"]) is None
+    assert parse_args_fast(["json", "extra"]) is None
+
+
@@ -0,0 +1,41 @@
+from   pathlib import Path
+
+from   supdoc.modules import find_all_modules, find_modules, is_package_dir
+
+#-------------------------------------------------------------------------------
+
+SRC_DIR = Path(__file__).parents[1] / "input" / "src"
+
+def test_is_package_dir():
+    assert is_package_dir(SRC_DIR / "mypackage")
+    assert not is_package_dir(SRC_DIR)
+    assert not is_package_dir(SRC_DIR / "mypackage" / "mymodule.py")
+
+
+def test_find_modules():
+    names = list(find_modules(SRC_DIR / "mypackage"))
+    assert names[0] == "mypackage"
+    assert sorted(names) == [
+        "mypackage", "mypackage.mymodule", "mypackage.support"]
+
+    names = list(find_modules(SRC_DIR / "mypackage" / "mymodule.py"))
+    assert names == ["mymodule"]
+
+    names = list(find_modules(SRC_DIR / "mypackage" / "mymodule.py", SRC_DIR))
+    assert names == ["mypackage.mymodule"]
+
+
+def test_find_all_modules():
+    assert sorted(find_all_modules(SRC_DIR)) == [
+        "mypackage", "mypackage.mymodule", "mypackage.support"]
+
+
+def test_find_modules_skip():
+    names = list(find_modules(
+        SRC_DIR / "mypackage", skip=lambda n: n.endswith(".support")))
+    assert sorted(names) == ["mypackage", "mypackage.mymodule"]
+
+    names = list(find_all_modules(SRC_DIR, skip=lambda n: n == "mypackage"))
+    assert names == []
+
+
@@ -0,0 +1,129 @@
+import pytest
+
+from   supdoc.lib.terminal.ansi import ESCAPE_REGEX
+from   supdoc.lib.terminal.html import convert
+
+#-------------------------------------------------------------------------------
+
+# HTML, and its text output at width 20 with escape sequences removed.  These
+# match the output of the original HTMLParser-based converter.
+CASES = [
+    (
+        "entities", "<p>a &amp; b &lt;c&gt; &quot;d&quot;</p>",
+        "a & b <c> \"d\"       \n"
+        "                    \n",
+    ),
+    (
+        "named_entities", "<p>caf&eacute; &mdash; &copy;</p>",
+        "café — ©            \n"
+        "                    \n",
+    ),
+    (
+        "char_refs", "<p>&#169; &#x263a; x&nbsp;y</p>",
+        "© ☺ x y             \n"
+        "                    \n",
+    ),
+    (
+        "pre", "<pre>  x = 1\n    y  =  2\n</pre>",
+        "┃   x = 1           \n"
+        "┃     y  =  2       \n",
+    ),
+    (
+        "pre_between", "<p>before</p><pre>a\tb\n  c</pre><p>after</p>",
+        "before              \n"
+        "                    \n"
+        "┃ a\tb               \n"
+        "┃   c               \n"
+        "after               \n"
+        "                    \n",
+    ),
+    (
+        "nested", "<p>one <b>two <i>three</i></b> four</p>",
+        "one two three four  \n"
+        "                    \n",
+    ),
+    (
+        "comment", "<p>a<!-- comment --> b</p>",
+        "a b                 \n"
+        "                    \n",
+    ),
+    (
+        "comment_outside", "<!-- lead --><p>x</p><!-- trail -->",
+        "x                   \n"
+        "                    \n",
+    ),
+    (
+        "form_feed", "form\x0cfeed",
+        "form feed",
+    ),
+    (
+        "form_feed_in_p", "<p>form\x0cfeed</p>",
+        "form feed           \n"
+        "                    \n",
+    ),
+    (
+        "nul", "<p>nul\x00byte</p>",
+        "nul\x00byte            \n"
+        "                    \n",
+    ),
+    (
+        "bell", "<p>bell\x07</p>",
+        "bell\x07               \n"
+        "                    \n",
+    ),
+    (
+        "pre_controls", "<pre>ff\x0cctl\x01</pre>",
+        "┃ ff\x0c"
+        "ctl\x01           \n",
+    ),
+    (
+        "controls_and_tag_whitespace", "<p>a\x01</p><pre\nclass=\"x\">y</pre>",
+        "a\x01                  \n"
+        "                    \n"
+        "┃ y                 \n",
+    ),
+    (
+        "surrogate", "<p>x\ud800y</p>",
+        "x\ud800y                 \n"
+        "                    \n",
+    ),
+    (
+        "bare_text", "text &amp; more",
+        "text & more",
+    ),
+]
+
+@pytest.mark.parametrize(
+    "html, expected", [ c[1 :] for c in CASES ], ids=[ c[0] for c in CASES ])
+def test_convert_text(html, expected):
+    assert ESCAPE_REGEX.sub("", convert(html, width=20)) == expected
+
+
+def test_convert_styles():
+    assert convert("<p>one <b>two <i>three</i></b> four</p>", width=20) == (
+        "\x1b[39;49;22;24;25;27;28m\x1b[39;49;22;24;25;27;28mone"
+        "\x1b[1m two\x1b[38;5;88m three\x1b[39m\x1b[22m four"
+        "\x1b[39;49;22;24;25;27;28m  \x1b[m\n"
+        "\x1b[39;49;22;24;25;27;28m                    \x1b[m\n"
+    )
+
+
+def test_convert_unclosed():
+    # The original converter failed an assertion on these.
+    assert ESCAPE_REGEX.sub("", convert("<p>a <b>bold</p>", width=20)) == (
+        "a bold              \n"
+        "                    \n"
+    )
+    html = "<ul><li>one<li>two</ul>"
+    assert ESCAPE_REGEX.sub("", convert(html, width=20)) == (
+        "  \u2219 one             \n"
+        "  \u2219 two             \n"
+    )
+
+
+def test_convert_control_in_attribute(caplog):
+    html = "<span class=\"x\x01\">a\x02</span>"
+    assert ESCAPE_REGEX.sub("", convert(html, width=20)) == "a\x02"
+    assert caplog.messages == ["unknown span class: x\x01"]
+
+
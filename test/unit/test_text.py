@@ -0,0 +1,31 @@
+from   supdoc.lib.text import get_common_indent, join_indented_pars, join_pars
+
+#-------------------------------------------------------------------------------
+
+LINES = [
+    "",
+    "  foo bar",
+    "    baz",
+    "",
+    "",
+    "      bif",
+    "        bof",
+    "   ",
+    "last",
+]
+
+def test_join_indented_pars():
+    pars = list(join_indented_pars(LINES))
+    assert pars == [
+        (2, ("foo bar", "  baz")),
+        (6, ("bif", "  bof")),
+        (0, ("last", )),
+    ]
+    assert pars == [ get_common_indent(p) for p in join_pars(LINES) ]
+
+
+def test_join_indented_pars_empty():
+    assert list(join_indented_pars([])) == []
+    assert list(join_indented_pars(["", "  "])) == []
+
+